@@ -3,15 +3,14 @@
 from __future__ import annotations
 
 import logging
-from datetime import timedelta
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_EMAIL, CONF_PASSWORD, Platform
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from .api import GoveeAPI
-from .const import DOMAIN, UPDATE_INTERVAL
+from .const import DOMAIN
+from .coordinator import GoveeDataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -25,17 +24,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         hass=hass, email=entry.data[CONF_EMAIL], password=entry.data[CONF_PASSWORD]
     )
 
-    async def async_update_data():
-        """Fetch data from API endpoint."""
-        return await hass.async_add_executor_job(api_client.get_devices)
-
-    coordinator = DataUpdateCoordinator(
-        hass,
-        _LOGGER,
-        name="govee_cloud",
-        update_method=async_update_data,
-        update_interval=timedelta(seconds=UPDATE_INTERVAL),
-    )
+    coordinator = GoveeDataUpdateCoordinator(hass, entry, api_client)
 
     await coordinator.async_config_entry_first_refresh()
 
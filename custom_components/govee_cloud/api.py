@@ -1,19 +1,41 @@
 """Govee Cloud API client."""
 
-import json
+import asyncio
 import logging
 import os
 import time
+from types import MappingProxyType
 from typing import Dict, List, Optional
 
 import jwt
-import requests
+import orjson
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
-from .const import DEVICES_ENDPOINT, LOGIN_ENDPOINT, THERMOMETER_SKU
+from .const import DEVICES_ENDPOINT, LOGIN_ENDPOINT, TOKEN_EXPIRY_MARGIN
 
 _LOGGER = logging.getLogger(__name__)
 
+# Client identifier the Govee app uses for both headers and login
+_CLIENT_ID = "53b5cfa4c9726a27"
+
+# Headers sent with every request to the Govee app API
+_BASE_HEADERS = MappingProxyType(
+    {
+        "sysVersion": "12",
+        "country": "US",
+        "appVersion": "7.0.30",
+        "clientId": _CLIENT_ID,
+        "clientType": "0",
+        "timezone": "America/New_York",
+        "Accept-Language": "en",
+        "envId": "0",
+        "iotVersion": "0",
+        "Content-Type": "application/json; charset=UTF-8",
+        "User-Agent": "okhttp/4.12.0",
+    }
+)
+
 
 class GoveeAPI:
     """Govee Cloud API client."""
@@ -24,7 +46,11 @@ class GoveeAPI:
         self.email = email
         self.password = password
         self._token = None
+        self._token_exp: Optional[int] = None
+        self._auth_lock = asyncio.Lock()
         self._token_file = os.path.join(hass.config.config_dir, ".govee_token.json")
+        self._token_file_tried = False
+        self._session = async_get_clientsession(hass)
 
     def govee_temp_value(self, api_value: int) -> float:
         """Extract temperature value from Govee API in Celsius."""
@@ -38,8 +64,8 @@ class GoveeAPI:
             return None
 
         try:
-            with open(self._token_file, "r") as f:
-                data = json.load(f)
+            with open(self._token_file, "rb") as f:
+                data = orjson.loads(f.read())
 
             token = data.get("token")
             if not token:
@@ -50,10 +76,12 @@ class GoveeAPI:
             exp = decoded.get("exp")
 
             if exp and exp > time.time():
-                _LOGGER.info(
-                    "Using cached token (expires: %s)",
-                    time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(exp)),
-                )
+                self._token_exp = exp
+                if _LOGGER.isEnabledFor(logging.INFO):
+                    _LOGGER.info(
+                        "Using cached token (expires: %s)",
+                        time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(exp)),
+                    )
                 return token
             else:
                 _LOGGER.info("Cached token expired, will need to re-authenticate")
@@ -63,47 +91,36 @@ class GoveeAPI:
             _LOGGER.debug("Error loading cached token: %s", err)
             return None
 
-    def _save_token(self, token: str) -> None:
+    def _save_token(self, token: str, exp: Optional[int]) -> None:
         """Save JWT token to file."""
+        if token == self._token:
+            _LOGGER.debug("Token unchanged, not rewriting cache file")
+            return
+
         try:
-            decoded = jwt.decode(token, options={"verify_signature": False})
-            exp = decoded.get("exp")
-            exp_str = (
-                time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(exp))
-                if exp
-                else "unknown"
-            )
-
-            with open(self._token_file, "w") as f:
-                json.dump({"token": token}, f)
-            _LOGGER.info("Token cached successfully (expires: %s)", exp_str)
+            # Write to a temporary file and swap it in so a crash mid-write
+            # cannot leave a corrupt token file behind
+            tmp_file = f"{self._token_file}.tmp"
+            with open(tmp_file, "wb") as f:
+                f.write(orjson.dumps({"token": token}))
+            os.replace(tmp_file, self._token_file)
+            if _LOGGER.isEnabledFor(logging.INFO):
+                exp_str = (
+                    time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(exp))
+                    if exp
+                    else "unknown"
+                )
+                _LOGGER.info("Token cached successfully (expires: %s)", exp_str)
         except Exception as err:
             _LOGGER.error("Failed to cache token: %s", err)
 
-    def _login(self) -> str:
+    async def _login(self) -> str:
         """Login to Govee API and return token."""
         _LOGGER.info("Authenticating with Govee API")
 
-        session = requests.Session()
-        session.headers.update(
-            {
-                "sysVersion": "12",
-                "country": "US",
-                "appVersion": "7.0.30",
-                "clientId": "53b5cfa4c9726a27",
-                "clientType": "0",
-                "timezone": "America/New_York",
-                "Accept-Language": "en",
-                "envId": "0",
-                "iotVersion": "0",
-                "Content-Type": "application/json; charset=UTF-8",
-                "User-Agent": "okhttp/4.12.0",
-            }
-        )
-
         timestamp = int(time.time() * 1000)
         login_data = {
-            "client": "53b5cfa4c9726a27",
+            "client": _CLIENT_ID,
             "code1": "",
             "email": self.email,
             "password": self.password,
@@ -112,81 +129,94 @@ class GoveeAPI:
             "transaction": str(timestamp),
         }
 
-        session.headers["timestamp"] = str(timestamp)
+        headers = {**_BASE_HEADERS, "timestamp": str(timestamp)}
 
-        response = session.post(LOGIN_ENDPOINT, json=login_data)
-        response.raise_for_status()
+        async with self._session.post(
+            LOGIN_ENDPOINT, json=login_data, headers=headers
+        ) as response:
+            response.raise_for_status()
+            data = orjson.loads(await response.read())
 
-        token = response.json()["client"]["token"]
-        self._save_token(token)
+        token = data["client"]["token"]
+        decoded = jwt.decode(token, options={"verify_signature": False})
+        self._token_exp = decoded.get("exp")
+        await self.hass.async_add_executor_job(self._save_token, token, self._token_exp)
         _LOGGER.info("Successfully authenticated with Govee API")
         return token
 
-    def _ensure_authenticated(self) -> None:
-        """Ensure we have a valid authentication token."""
-        if self._token is None:
-            self._token = self._load_token()
-
-        if self._token is None:
-            self._token = self._login()
-
-    def get_devices(self) -> List[Dict]:
-        """Get list of thermometer devices."""
-        self._ensure_authenticated()
-
-        session = requests.Session()
-        session.headers.update(
-            {
-                "sysVersion": "12",
-                "country": "US",
-                "appVersion": "7.0.30",
-                "clientId": "53b5cfa4c9726a27",
-                "clientType": "0",
-                "timezone": "America/New_York",
-                "Accept-Language": "en",
-                "envId": "0",
-                "iotVersion": "0",
-                "Content-Type": "application/json; charset=UTF-8",
-                "User-Agent": "okhttp/4.12.0",
-                "Authorization": f"Bearer {self._token}",
-            }
+    def _token_expiring(self) -> bool:
+        """Return True if the current token is about to expire."""
+        return (
+            self._token_exp is not None
+            and self._token_exp - TOKEN_EXPIRY_MARGIN <= time.time()
         )
 
-        response = session.get(DEVICES_ENDPOINT)
-        response.raise_for_status()
-        data = response.json()
-
-        if (status := data.get("status")) and status == 401:
+    async def _ensure_authenticated(self) -> None:
+        """Ensure we have a valid authentication token."""
+        if self._token is not None and not self._token_expiring():
+            return
+
+        # Serialize re-authentication so concurrent callers share one login
+        async with self._auth_lock:
+            # The token file only needs to be read once per start; afterwards
+            # the in-memory token is at least as fresh as the one on disk.
+            if self._token is None and not self._token_file_tried:
+                self._token_file_tried = True
+                self._token = await self.hass.async_add_executor_job(self._load_token)
+
+            if self._token is None or self._token_expiring():
+                self._token = await self._login()
+
+    async def async_get_devices(self) -> List[Dict]:
+        """Get list of all devices on the account."""
+        await self._ensure_authenticated()
+
+        token = self._token
+        headers = {**_BASE_HEADERS, "Authorization": f"Bearer {token}"}
+
+        async with self._session.get(DEVICES_ENDPOINT, headers=headers) as response:
+            unauthorized = response.status == 401
+            if not unauthorized:
+                response.raise_for_status()
+                data = orjson.loads(await response.read())
+                # Govee may also report an expired token in the response body
+                unauthorized = data.get("status") == 401
+
+        if unauthorized:
             _LOGGER.warning("Token expired, re-authenticating")
-            self._token = None
-            self._ensure_authenticated()
-            session.headers["Authorization"] = f"Bearer {self._token}"
-            response = session.get(DEVICES_ENDPOINT)
-            response.raise_for_status()
-            data = response.json()
-
-        # Filter for thermometer devices
+            # Log in again rather than reloading the token file, which
+            # still holds the token the server just rejected. Another
+            # caller may already have replaced it while we waited.
+            async with self._auth_lock:
+                if self._token == token:
+                    self._token = await self._login()
+            headers["Authorization"] = f"Bearer {self._token}"
+            async with self._session.get(DEVICES_ENDPOINT, headers=headers) as response:
+                response.raise_for_status()
+                data = orjson.loads(await response.read())
+
+        # Platforms filter for the device types they support
         devices = data.get("data", {}).get("devices", [])
-        thermometers = [d for d in devices if d.get("sku") == THERMOMETER_SKU]
 
-        _LOGGER.debug("Found %d thermometer devices", len(thermometers))
-        return thermometers
+        _LOGGER.debug("Found %d devices", len(devices))
+        return devices
 
     def extract_device_data(self, device: Dict) -> Dict:
         """Extract temperature and other data from device."""
         device_ext = device.get("deviceExt", {})
         last_device_data_str = device_ext.get("lastDeviceData", "{}")
-        last_device_data = json.loads(last_device_data_str)
+        last_device_data = orjson.loads(last_device_data_str)
 
         temp_raw = last_device_data.get("tem")
         temperature = self.govee_temp_value(temp_raw) if temp_raw is not None else None
 
+        hum_raw = last_device_data.get("hum")
+        humidity = hum_raw / 100.0 if hum_raw is not None else None
+
         return {
             "temperature": temperature,
-            "humidity": last_device_data.get("hum", 0) / 100.0
-            if last_device_data.get("hum")
-            else None,
-            "battery": json.loads(device_ext.get("deviceSettings", "{}")).get(
+            "humidity": humidity,
+            "battery": orjson.loads(device_ext.get("deviceSettings", "{}")).get(
                 "battery"
             ),
             "online": last_device_data.get("online", False),
@@ -10,7 +10,7 @@ from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import FlowResult
 
 from .api import GoveeAPI
-from .const import DOMAIN
+from .const import DOMAIN, SUPPORTED_SKUS
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -19,10 +19,11 @@ async def validate_input(hass: HomeAssistant, data: Dict[str, Any]) -> Dict[str,
     """Validate the user input allows us to connect."""
     api_client = GoveeAPI(hass, data[CONF_EMAIL], data[CONF_PASSWORD])
 
-    # Test authentication by getting devices using executor
-    devices = await hass.async_add_executor_job(api_client.get_devices)
+    # Test authentication by getting devices
+    devices = await api_client.async_get_devices()
+    supported = [d for d in devices if d.get("sku") in SUPPORTED_SKUS]
 
-    return {"title": f"Govee Cloud ({data[CONF_EMAIL]})", "num_devices": len(devices)}
+    return {"title": f"Govee Cloud ({data[CONF_EMAIL]})", "num_devices": len(supported)}
 
 
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
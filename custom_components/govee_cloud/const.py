@@ -10,9 +10,20 @@ DEVICES_ENDPOINT = f"{API_BASE_URL}/bff-app/v1/device/list"
 # Device types
 THERMOMETER_SKU = "H5111"
 
+# Device types with platform support; other account devices are ignored
+SUPPORTED_SKUS = {THERMOMETER_SKU}
+
 # Configuration keys
 CONF_EMAIL = "email"
 CONF_PASSWORD = "password"
 
-# Update interval
+# Proactively re-authenticate this many seconds before the token expires
+TOKEN_EXPIRY_MARGIN = 300  # 5 minutes
+
+# Update intervals (seconds)
 UPDATE_INTERVAL = 300  # 5 minutes
+FAST_UPDATE_INTERVAL = 60  # while a device is actively reporting
+MAX_UPDATE_INTERVAL = 3600  # backoff ceiling while the API is failing
+
+# A device counts as active if it reported within this many seconds
+RECENT_ACTIVITY_WINDOW = 120
@@ -0,0 +1,76 @@
+"""Data update coordinator for the Govee Cloud integration."""
+
+import logging
+import time
+from datetime import timedelta
+from typing import Any, Dict, Tuple
+
+from aiohttp import ClientError
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
+
+from .api import GoveeAPI
+from .const import (
+    FAST_UPDATE_INTERVAL,
+    MAX_UPDATE_INTERVAL,
+    RECENT_ACTIVITY_WINDOW,
+    SUPPORTED_SKUS,
+    UPDATE_INTERVAL,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class GoveeDataUpdateCoordinator(DataUpdateCoordinator):
+    """Coordinator that adapts its polling interval to the API and devices."""
+
+    def __init__(
+        self, hass: HomeAssistant, entry: ConfigEntry, api_client: GoveeAPI
+    ) -> None:
+        """Initialize the coordinator."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            config_entry=entry,
+            name="govee_cloud",
+            update_interval=timedelta(seconds=UPDATE_INTERVAL),
+        )
+        self.api_client = api_client
+
+    async def _async_update_data(self) -> Dict[str, Tuple[Dict, Dict[str, Any]]]:
+        """Fetch data from API endpoint, keyed by device MAC address."""
+        try:
+            devices = await self.api_client.async_get_devices()
+        except (ClientError, TimeoutError):
+            # Back off while the cloud API is failing
+            self.update_interval = min(
+                self.update_interval * 2, timedelta(seconds=MAX_UPDATE_INTERVAL)
+            )
+            _LOGGER.debug("Update failed, next poll in %s", self.update_interval)
+            raise
+
+        # Only parse payloads of device types a platform handles
+        data = {
+            device["device"]: (device, self.api_client.extract_device_data(device))
+            for device in devices
+            if device.get("sku") in SUPPORTED_SKUS
+        }
+
+        # Poll faster while any supported device is actively reporting
+        if self._recently_active(data):
+            self.update_interval = timedelta(seconds=FAST_UPDATE_INTERVAL)
+        else:
+            self.update_interval = timedelta(seconds=UPDATE_INTERVAL)
+
+        return data
+
+    @staticmethod
+    def _recently_active(data: Dict[str, Tuple[Dict, Dict[str, Any]]]) -> bool:
+        """Return True if any device reported within the activity window."""
+        # lastTime is reported in milliseconds since the epoch
+        cutoff = (time.time() - RECENT_ACTIVITY_WINDOW) * 1000
+        return any(
+            (last_update := sensor_data.get("last_update")) and last_update >= cutoff
+            for _, sensor_data in data.values()
+        )
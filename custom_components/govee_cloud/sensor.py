@@ -18,7 +18,7 @@ from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
 )
 
-from .const import DOMAIN
+from .const import DOMAIN, THERMOMETER_SKU
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -34,8 +34,9 @@ async def async_setup_entry(
     api_client = data["api_client"]
 
     entities = []
-    for device in coordinator.data:
-        device_id = device.get("device")  # MAC address
+    for device_id, (device, sensor_data) in coordinator.data.items():
+        if device.get("sku") != THERMOMETER_SKU:
+            continue
 
         # Add temperature sensor
         entities.append(
@@ -44,9 +45,6 @@ async def async_setup_entry(
             )
         )
 
-        # Extract device data to check what sensors to add
-        sensor_data = api_client.extract_device_data(device)
-
         # Add humidity sensor if available
         if sensor_data.get("humidity") is not None:
             entities.append(
@@ -81,39 +79,29 @@ class GoveeBaseSensor(CoordinatorEntity, SensorEntity):
         super().__init__(coordinator)
         self.api_client = api_client
         self.device_id = device_id
-        self.device_info_dict = device_info
         self.config_entry = config_entry
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self.device_id)},
-            name=self.device_info_dict.get("deviceName", "Govee Thermometer"),
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, device_id)},
+            name=device_info.get("deviceName", "Govee Thermometer"),
             manufacturer="Govee",
-            model=self.device_info_dict.get("sku"),
-            sw_version=self.device_info_dict.get("versionSoft"),
-            hw_version=self.device_info_dict.get("versionHard"),
+            model=device_info.get("sku"),
+            sw_version=device_info.get("versionSoft"),
+            hw_version=device_info.get("versionHard"),
         )
 
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
-        return self.coordinator.last_update_success and self._get_device() is not None
-
-    def _get_device(self) -> Optional[Dict[str, Any]]:
-        """Get device data from coordinator."""
-        for device in self.coordinator.data:
-            if device.get("device") == self.device_id:
-                return device
-        return None
+        return (
+            self.coordinator.last_update_success
+            and self.device_id in self.coordinator.data
+        )
 
     def _get_sensor_data(self) -> Dict[str, Any]:
         """Get sensor data for this device."""
-        device = self._get_device()
-        if device is None:
+        if (entry := self.coordinator.data.get(self.device_id)) is None:
             return {}
-        return self.api_client.extract_device_data(device)
+        return entry[1]
 
 
 class GoveeTemperatureSensor(GoveeBaseSensor):